@@ -8,14 +8,165 @@ Supports bar charts and line plots with automatic column detection.
 Usage examples:
     python data_visualizer.py data.csv
     python data_visualizer.py data.csv --chart bar --x column1 --y column2 --output chart.png
+    python data_visualizer.py log.csv --chart line --follow --output chart.png
 """
 
+import io
+import json
+import hashlib
 import pandas as pd
 import matplotlib.pyplot as plt
 import click
 import sys
 from pathlib import Path
 
+# Bytes read per step in follow mode; blocks always end on a complete line
+BLOCK_SIZE = 64 * 1024 * 1024
+# Leading bytes hashed to recognise a replaced (rotated) log with the same header
+FINGERPRINT_SIZE = 64 * 1024
+
+
+def file_fingerprint(csv_file, length):
+    """Hash the first length bytes, which never change while a file is only appended to."""
+    with open(csv_file, 'rb') as f:
+        return hashlib.blake2b(f.read(length), digest_size=16).hexdigest()
+
+
+def iter_new_blocks(csv_file, offset):
+    """Yield (bytes, offset after them) for complete lines appended after offset."""
+    with open(csv_file, 'rb') as f:
+        f.seek(offset)
+        carry = b''
+        while True:
+            block = f.read(BLOCK_SIZE)
+            if not block:
+                break
+            data = carry + block
+            end = data.rfind(b'\n') + 1
+            if end == 0:
+                carry = data
+                continue
+            carry = data[end:]
+            offset += end
+            yield data[:end], offset
+
+
+def load_state(state_file):
+    """Load the follow-mode state from a previous run, if any."""
+    try:
+        with open(state_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_state(state_file, state):
+    tmp_file = Path(str(state_file) + '.tmp')
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    tmp_file.replace(state_file)
+
+
+def new_state(csv_file, chart, x, y, max_points):
+    """Start a fresh state by reading the CSV header."""
+    with open(csv_file, 'rb') as f:
+        header = f.readline()
+    if not header.endswith(b'\n'):
+        return None
+    columns = pd.read_csv(io.BytesIO(header)).columns.tolist()
+    return {
+        'offset': len(header), 'header': header.decode('utf-8', errors='replace'),
+        'columns': columns, 'chart': chart, 'x_arg': x, 'y_arg': y, 'max_points': max_points,
+        'x': None, 'y': None, 'x_numeric': None,
+        'rows': 0, 'stride': 1, 'xs': [], 'ys': [],
+        'count': 0, 'sum': 0.0, 'min': None, 'max': None,
+    }
+
+
+def resolve_columns(state, df):
+    """Pick the X/Y columns on the first rows seen, mirroring the non-incremental auto-detection."""
+    numeric_cols = df.select_dtypes(include=['number']).columns.tolist()
+    x, y = state['x_arg'], state['y_arg']
+    if len(numeric_cols) < 2 and (x is None or y is None):
+        print("Error: Need at least 2 numeric columns for plotting, or specify --x and --y")
+        return False
+    if x is None:
+        x = numeric_cols[0] if len(numeric_cols) > 0 else df.columns[0]
+    if y is None:
+        y = numeric_cols[1]
+    state['x'], state['y'] = x, y
+    state['x_numeric'] = x in numeric_cols
+    return True
+
+
+def update_state(state, df):
+    """Fold newly parsed rows into the running aggregates and downsampled series."""
+    xs = df[state['x']]
+    xs = pd.to_numeric(xs, errors='coerce') if state['x_numeric'] else xs.astype(str)
+    ys = pd.to_numeric(df[state['y']], errors='coerce')
+
+    valid = ys.dropna()
+    if len(valid):
+        state['count'] += int(len(valid))
+        state['sum'] += float(valid.sum())
+        state['min'] = float(valid.min()) if state['min'] is None else min(state['min'], float(valid.min()))
+        state['max'] = float(valid.max()) if state['max'] is None else max(state['max'], float(valid.max()))
+
+    # Keep every stride-th row overall; halve the series whenever it outgrows max_points
+    start = (-state['rows']) % state['stride']
+    state['xs'].extend(xs.iloc[start::state['stride']].tolist())
+    state['ys'].extend(ys.iloc[start::state['stride']].tolist())
+    state['rows'] += len(df)
+    while len(state['xs']) > state['max_points']:
+        state['xs'] = state['xs'][::2]
+        state['ys'] = state['ys'][::2]
+        state['stride'] *= 2
+
+
+def follow_csv(csv_file, chart, x, y, max_points, state_file):
+    """Parse only the bytes appended since the last run and return the updated state."""
+    state = load_state(state_file)
+    stat = Path(csv_file).stat()
+    if state is not None:
+        with open(csv_file, 'rb') as f:
+            header = f.readline().decode('utf-8', errors='replace')
+        # Start over if the file was truncated/rotated or the options changed
+        replaced = (stat.st_ino != state.get('inode')
+                    or file_fingerprint(csv_file, state.get('fingerprint_len', 0)) != state.get('fingerprint'))
+        if (stat.st_size < state['offset'] or header != state['header'] or replaced
+                or (state['chart'], state['x_arg'], state['y_arg'], state['max_points']) != (chart, x, y, max_points)):
+            print("CSV or options changed since the last run; rebuilding state")
+            state = None
+    if state is None:
+        state = new_state(csv_file, chart, x, y, max_points)
+        if state is None:
+            print("Error: CSV has no complete header line yet")
+            return None
+
+    new_rows = 0
+    for block, offset in iter_new_blocks(csv_file, state['offset']):
+        df = pd.read_csv(io.BytesIO(block), header=None, names=state['columns'])
+        if state['x'] is None and not resolve_columns(state, df):
+            return None
+        update_state(state, df)
+        state['offset'] = offset
+        new_rows += len(df)
+
+    if state['x'] is None:
+        print("Error: CSV has no data rows yet")
+        return None
+
+    state['inode'] = stat.st_ino
+    state['fingerprint_len'] = min(state['offset'], FINGERPRINT_SIZE)
+    state['fingerprint'] = file_fingerprint(csv_file, state['fingerprint_len'])
+    save_state(state_file, state)
+    print(f"Parsed {new_rows} new rows ({state['rows']} total, {len(state['xs'])} plotted, "
+          f"stride {state['stride']})")
+    if state['count']:
+        print(f"{state['y']}: min={state['min']:g}, max={state['max']:g}, "
+              f"mean={state['sum'] / state['count']:g}")
+    return state
+
 
 @click.command()
 @click.argument('csv_file', type=click.Path(exists=True))
@@ -24,9 +175,22 @@ from pathlib import Path
 @click.option('--y', help='Y-axis column name (optional, uses second numeric if not specified)')
 @click.option('--output', default=None, type=click.Path(), help='Output file path for saving chart (e.g., chart.png)')
 @click.option('--title', default='Data Visualization', help='Chart title')
-def visualize_csv(csv_file, chart, x, y, output, title):
+@click.option('--follow', is_flag=True, help='Incremental mode: only parse rows appended since the last run')
+@click.option('--max-points', default=10000, type=click.IntRange(1), show_default=True,
+              help='Maximum points kept in the downsampled series (follow mode)')
+@click.option('--state-file', default=None, type=click.Path(),
+              help='Where follow mode keeps its state (default: CSV_FILE.viz-state.json)')
+def visualize_csv(csv_file, chart, x, y, output, title, follow, max_points, state_file):
     """Visualize CSV data with basic charts."""
     try:
+        if follow:
+            state_file = state_file or f"{csv_file}.viz-state.json"
+            state = follow_csv(csv_file, chart, x, y, max_points, state_file)
+            if state is None:
+                return
+            render_chart(state['xs'], state['ys'], chart, state['x'], state['y'], title, output)
+            return
+
         # Load CSV file
         df = pd.read_csv(csv_file)
         print(f"Loaded CSV with {len(df)} rows and {len(df.columns)} columns")
@@ -48,38 +212,41 @@ def visualize_csv(csv_file, chart, x, y, output, title):
             print("Error: Y column must be specified or auto-detected from numeric columns")
             return
 
-        print(f"Plotting {chart} chart: X={x}, Y={y}")
+        render_chart(df[x], df[y], chart, x, y, title, output)
+
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        sys.exit(1)
+
 
-        # Create the plot
-        plt.figure(figsize=(10, 6))
+def render_chart(x_values, y_values, chart, x, y, title, output):
+    """Draw the chart and save it to output, or show it when no output is given."""
+    print(f"Plotting {chart} chart: X={x}, Y={y}")
 
-        if chart == 'bar':
-            plt.bar(df[x], df[y])
-            plt.xlabel(x)
-            plt.ylabel(y)
-        elif chart == 'line':
-            plt.plot(df[x], df[y], marker='o')
-            plt.xlabel(x)
-            plt.ylabel(y)
+    # Create the plot
+    plt.figure(figsize=(10, 6))
 
-        plt.title(title)
-        plt.grid(True, alpha=0.3)
-        plt.xticks(rotation=45)
-        plt.tight_layout()
+    if chart == 'bar':
+        plt.bar(x_values, y_values)
+        plt.xlabel(x)
+        plt.ylabel(y)
+    elif chart == 'line':
+        plt.plot(x_values, y_values, marker='o')
+        plt.xlabel(x)
+        plt.ylabel(y)
 
-        # Save or show
-        if output:
-            plt.savefig(output, dpi=300, bbox_inches='tight')
-            print(f"Chart saved to {output}")
-        else:
-            plt.show()
+    plt.title(title)
+    plt.grid(True, alpha=0.3)
+    plt.xticks(rotation=45)
+    plt.tight_layout()
 
-    except Exception as e:
-        print(f"Error: {str(e)}")
-        sys.exit(1)
+    # Save or show
+    if output:
+        plt.savefig(output, dpi=300, bbox_inches='tight')
+        print(f"Chart saved to {output}")
+    else:
+        plt.show()
 
 
 if __name__ == '__main__':
-    visualize_csv()</content>
-</xai:function_call name="write_file">
-<parameter name="file_path">data_visualizer.py
\ No newline at end of file
+    visualize_csv()
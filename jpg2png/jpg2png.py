@@ -6,16 +6,299 @@ A simple command-line tool for batch converting JPG images to PNG format with ap
 Usage: python jpg2png.py [folder_path] [options]
 """
 
+import io
 import os
 import sys
+import json
+import time
+import queue
+import shutil
+import hashlib
 from pathlib import Path
 from datetime import datetime
 import click
 from PIL import Image
-from typing import List
+from typing import BinaryIO, Iterator, List, Optional, Union
 import tkinter as tk
 from tkinter import filedialog
 
+# The watch-mode helpers below are kept identical to the ones in pdf2docx/pdf2docx.py:
+# each tool ships as a standalone module with its own setup.py.
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # Watch mode falls back to polling without watchdog
+    Observer = None
+    FileSystemEventHandler = object
+
+
+class _NewFileHandler(FileSystemEventHandler):
+    """Forwards paths of created, modified and moved-in files to a queue."""
+
+    def __init__(self, events: queue.Queue):
+        self.events = events
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.events.put(Path(event.src_path))
+
+    on_modified = on_created
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.events.put(Path(event.dest_path))
+
+
+class FolderWatcher:
+    """Watches a folder for new files and hands them out in micro-batches.
+
+    Uses inotify (through watchdog) when available and falls back to polling.
+    A file is only handed out once its size and mtime have stayed unchanged
+    for ``settle_time`` seconds, so files still being written are never picked up.
+    """
+
+    def __init__(self, folder: Path, extensions: set, recursive: bool = False,
+                 settle_time: float = 2.0, batch_size: int = 16,
+                 batch_window: float = 3.0, poll_interval: float = 1.0):
+        self.folder = Path(folder)
+        self.extensions = {ext.lower() for ext in extensions}
+        self.recursive = recursive
+        self.settle_time = settle_time
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.poll_interval = poll_interval
+        self.backend = 'inotify' if Observer is not None else 'polling'
+        self.events = queue.Queue()
+        self.pending = {}  # path -> ((size, mtime), time the signature was last seen changing)
+        self.seen = {}
+        self.observer = None
+        self.started = False
+
+    def scan(self) -> dict:
+        """Return a {path: (size, mtime)} snapshot of matching files."""
+        pattern = '**/*' if self.recursive else '*'
+        snapshot = {}
+        for path in self.folder.glob(pattern):
+            if path.suffix.lower() in self.extensions:
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def poll(self):
+        """Queue files that appeared or changed since the last scan (polling backend)."""
+        snapshot = self.scan()
+        for path, signature in snapshot.items():
+            if self.seen.get(path) != signature:
+                self.events.put(path)
+        self.seen = snapshot
+
+    def collect_ready(self, now: float) -> List[Path]:
+        """Drain queued events and return the files that have finished writing."""
+        while True:
+            try:
+                path = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if path.suffix.lower() in self.extensions:
+                self.pending.setdefault(path, None)
+
+        ready = []
+        for path, last in list(self.pending.items()):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                del self.pending[path]
+                continue
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if last is None or last[0] != signature:
+                self.pending[path] = (signature, now)
+            elif now - last[1] >= self.settle_time:
+                ready.append(path)
+                del self.pending[path]
+        return ready
+
+    def start(self):
+        """Start collecting events; files that arrive from now on will be handed out.
+        
+        Call this before converting the files already present so that nothing
+        arriving during that first pass is missed.
+        """
+        if self.started:
+            return
+        if self.backend == 'inotify':
+            self.observer = Observer()
+            self.observer.schedule(_NewFileHandler(self.events), str(self.folder),
+                                   recursive=self.recursive)
+            self.observer.start()
+        else:
+            self.seen = self.scan()
+        self.started = True
+
+    def stop(self):
+        """Stop the inotify observer, if one is running."""
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+        self.started = False
+
+    def watch(self) -> Iterator[List[Path]]:
+        """Yield batches of new, fully written files until interrupted."""
+        self.start()
+        batch, batch_started = [], 0.0
+        try:
+            while True:
+                time.sleep(self.poll_interval)
+                if self.backend == 'polling':
+                    self.poll()
+                now = time.monotonic()
+                ready = self.collect_ready(now)
+                if ready and not batch:
+                    batch_started = now
+                batch.extend(ready)
+                while batch and (len(batch) >= self.batch_size
+                                 or now - batch_started >= self.batch_window):
+                    yield sorted(batch[:self.batch_size])
+                    batch = batch[self.batch_size:]
+                    batch_started = now
+        finally:
+            self.stop()
+
+
+class HashIndex:
+    """Persistent index of converted PNGs keyed by source content and perceptual hash.
+
+    Stored as JSON in the output folder so later runs (and watch mode) can reuse
+    a PNG already produced from identical JPG data instead of encoding it again.
+    """
+
+    filename = '.jpg2png-index.json'
+
+    def __init__(self, path: Path, max_distance: int = 6):
+        self.path = Path(path).resolve()
+        self.max_distance = max_distance
+        # PNG paths are stored relative to the index's folder, so they stay valid no
+        # matter which directory (or spelling of the output folder) the tool runs from
+        self.exact = {}       # content hash -> {'png': relative path, 'size': ..., 'mtime_ns': ...}
+        self.perceptual = {}  # 64-bit difference hash -> relative PNG path
+        if self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding='utf-8'))
+                self.exact = data.get('exact', {})
+                self.perceptual = {int(key, 16): png for key, png in data.get('perceptual', {}).items()}
+            except (OSError, ValueError) as e:
+                click.echo(f"⚠️  Ignoring unreadable hash index {self.path}: {e}", err=True)
+
+    @staticmethod
+    def content_hash(path: Path) -> str:
+        """Hash the raw file bytes; identical files always produce the same PNG."""
+        digest = hashlib.blake2b(digest_size=20)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def perceptual_hash(path: Path) -> Optional[int]:
+        """Compute a 64-bit difference hash from a draft-mode (downscaled) decode."""
+        try:
+            with Image.open(path) as img:
+                img.draft('L', (64, 64))
+                pixels = img.convert('L').resize((9, 8), Image.BILINEAR).tobytes()
+        except Exception:
+            return None  # Let the regular conversion report unreadable files
+        
+        value = 0
+        for row in range(8):
+            for col in range(8):
+                left, right = pixels[row * 9 + col], pixels[row * 9 + col + 1]
+                value = (value << 1) | (left > right)
+        return value
+
+    def find_exact(self, content_hash: str) -> Optional[Path]:
+        """Return the PNG previously converted from identical data, if it is unchanged since."""
+        entry = self.exact.get(content_hash)
+        if entry is None:
+            return None
+        try:
+            stat = self.absolute(entry['png']).stat()
+        except FileNotFoundError:
+            stat = None
+        if stat is None or (stat.st_size, stat.st_mtime_ns) != (entry['size'], entry['mtime_ns']):
+            # The PNG was removed or rewritten (e.g. from a changed JPG); it no longer matches
+            del self.exact[content_hash]
+            return None
+        return self.absolute(entry['png'])
+
+    def find_similar(self, phash: int) -> Optional[Path]:
+        """Return the closest indexed PNG within ``max_distance`` bits, if any."""
+        best, best_distance = None, self.max_distance + 1
+        for other, png in self.perceptual.items():
+            distance = bin(phash ^ other).count('1')
+            if distance < best_distance and self.absolute(png).exists():
+                best, best_distance = png, distance
+        return self.absolute(best) if best is not None else None
+
+    def add(self, png_path: Path, content_hash: Optional[str] = None, phash: Optional[int] = None):
+        """Record a freshly written PNG, replacing older hashes that pointed at the same path."""
+        png = self.relative(png_path)
+        self.exact = {key: entry for key, entry in self.exact.items() if entry['png'] != png}
+        self.perceptual = {key: other for key, other in self.perceptual.items() if other != png}
+        if content_hash is not None:
+            stat = png_path.stat()
+            self.exact[content_hash] = {'png': png, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        if phash is not None:
+            self.perceptual[phash] = png
+
+    def save(self):
+        """Write the index atomically next to the converted files."""
+        data = {
+            'exact': self.exact,
+            'perceptual': {f'{phash:016x}': png for phash, png in self.perceptual.items()},
+        }
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        tmp_path.write_text(json.dumps(data, indent=1), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+
+    def relative(self, png_path: Path) -> str:
+        """Path of a PNG as stored in the index."""
+        return os.path.relpath(Path(png_path).resolve(), self.path.parent)
+
+    def absolute(self, png: str) -> Path:
+        """Resolve a stored PNG path against the index's folder."""
+        return self.path.parent / png
+
+    @staticmethod
+    def same_file(first: Path, second: Path) -> bool:
+        """True if both paths name the same file, however they are spelled."""
+        try:
+            return os.path.samefile(first, second)
+        except OSError:
+            return Path(first).resolve() == Path(second).resolve()
+
+    @staticmethod
+    def link_or_copy(source: Path, destination: Path):
+        """Hard-link ``source`` to ``destination``, copying when linking isn't possible.
+        
+        The link or copy is made under a temp name and swapped in, so an existing
+        destination is only replaced once the new file is complete.
+        """
+        tmp_path = destination.with_name(destination.name + '.tmp')
+        if tmp_path.exists():
+            tmp_path.unlink()
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, destination)
+        if tmp_path.exists():
+            tmp_path.unlink()  # rename() is a no-op when both names are links to the same file
+        os.utime(destination)  # Keep the output newer than its source so later runs skip it
+
+
 class ImageConverter:
     """Handles JPG to PNG conversion with progress tracking."""
     
@@ -23,6 +306,7 @@ class ImageConverter:
         self.target_folder = Path(target_folder)
         self.supported_extensions = {'.jpg', '.jpeg', '.JPG', '.JPEG'}
         self.converted_files = []
+        self.hash_index = None
         
     def find_jpg_files(self) -> List[Path]:
         """Find all JPG files in the target folder."""
@@ -49,38 +333,77 @@ class ImageConverter:
         else:
             return jpg_path.with_suffix('.png')
     
+    @staticmethod
+    def convert_stream(source: Union[Path, BinaryIO], destination: Union[Path, BinaryIO],
+                       quality: int = 95):
+        """Convert JPG data to PNG, reading and writing paths or binary file objects.
+        
+        Raises the underlying Pillow error if the input cannot be converted.
+        """
+        with Image.open(source) as img:
+            if img.mode != 'RGBA' and 'transparency' in img.info:
+                img = img.convert('RGBA')
+            else:
+                img = img.convert('RGB')
+            
+            img.save(destination, 'PNG', optimize=True, compress_level=quality)
+    
+    @staticmethod
+    def convert_bytes(data: Union[bytes, BinaryIO], quality: int = 95) -> bytes:
+        """Convert JPG bytes (or a binary file object) to PNG bytes in memory."""
+        source = io.BytesIO(data) if isinstance(data, (bytes, bytearray)) else data
+        output = io.BytesIO()
+        ImageConverter.convert_stream(source, output, quality)
+        return output.getvalue()
+    
     def convert_image(self, jpg_path: Path, output_path: Path, quality: int = 95) -> bool:
         """Convert a single JPG to PNG."""
+        # Write to a temp file and swap it in, so a PNG hard-linked by --dedupe is
+        # replaced rather than overwritten in place (which would change every link)
+        tmp_path = output_path.with_name(output_path.name + '.tmp')
         try:
-            with Image.open(jpg_path) as img:
-                if img.mode != 'RGBA' and 'transparency' in img.info:
-                    img = img.convert('RGBA')
-                else:
-                    img = img.convert('RGB')
-                
-                img.save(output_path, 'PNG', optimize=True, compress_level=quality)
-                return True
+            self.convert_stream(jpg_path, tmp_path, quality)
+            os.replace(tmp_path, output_path)
+            return True
                 
         except Exception as e:
             click.echo(f"❌ Error converting {jpg_path.name}: {e}", err=True)
+            if tmp_path.exists():
+                tmp_path.unlink()
             return False
     
     def process_folder(self, output_folder: Path = None, prefix_format: str = None, 
-                      recursive: bool = False, quality: int = 95) -> dict:
-        """Process all JPG files in the folder."""
+                      recursive: bool = False, quality: int = 95, files: List[Path] = None,
+                      dedupe: bool = False, perceptual: bool = False) -> dict:
+        """Process all JPG files in the folder, or only the given files.
+        
+        With ``dedupe`` enabled, files whose bytes match an already converted JPG are
+        hard-linked (or copied) from the existing PNG instead of being encoded again.
+        ``perceptual`` reports visually near-identical images; it never skips a conversion.
+        """
         if output_folder is None:
             output_folder = self.target_folder
         
         # Create output folder if it doesn't exist
         output_folder.mkdir(parents=True, exist_ok=True)
         
-        jpg_files = self.find_jpg_files() if recursive else [f for f in self.target_folder.glob('*') 
-                                                           if f.suffix.lower() in self.supported_extensions]
+        if files is not None:
+            jpg_files = files
+        else:
+            jpg_files = self.find_jpg_files() if recursive else [f for f in self.target_folder.glob('*') 
+                                                               if f.suffix.lower() in self.supported_extensions]
+        
+        results = {'converted': 0, 'skipped': 0, 'deduplicated': 0, 'near_duplicates': [], 'files': []}
         
         if not jpg_files:
-            return {'converted': 0, 'skipped': 0, 'files': []}
+            return results
         
-        results = {'converted': 0, 'skipped': 0, 'files': []}
+        index = None
+        if dedupe or perceptual:
+            index_path = output_folder / HashIndex.filename
+            if self.hash_index is None or self.hash_index.path != index_path.resolve():
+                self.hash_index = HashIndex(index_path)
+            index = self.hash_index
         
         with click.progressbar(jpg_files, label='Converting images') as bar:
             for jpg_file in bar:
@@ -95,16 +418,45 @@ class ImageConverter:
                     results['skipped'] += 1
                     continue
                 
+                content_hash = phash = None
+                if dedupe:
+                    try:
+                        content_hash = index.content_hash(jpg_file)
+                    except OSError as e:
+                        click.echo(f"❌ Error reading {jpg_file.name}: {e}", err=True)
+                        continue
+                    existing = index.find_exact(content_hash)
+                    if existing is not None and not index.same_file(existing, png_path):
+                        index.link_or_copy(existing, png_path)
+                        # Linking touches the shared mtime, so re-record the hash against the new link
+                        index.add(png_path, content_hash)
+                        results['deduplicated'] += 1
+                        results['files'].append(png_path)
+                        self.converted_files.append(png_path)
+                        continue
+                
+                if perceptual:
+                    phash = index.perceptual_hash(jpg_file)
+                    similar = index.find_similar(phash) if phash is not None else None
+                    if similar is not None and not index.same_file(similar, png_path):
+                        results['near_duplicates'].append((jpg_file, similar))
+                
                 if self.convert_image(jpg_file, png_path, quality):
                     results['converted'] += 1
                     results['files'].append(png_path)
                     self.converted_files.append(png_path)
+                    if index is not None:
+                        index.add(png_path, content_hash, phash)
+        
+        if index is not None:
+            index.save()
         
         return results
 
 
 @click.command()
-@click.argument('folder_path', required=False, type=click.Path(exists=True, file_okay=False, dir_okay=True))
+@click.argument('folder_path', required=False,
+                type=click.Path(exists=True, file_okay=True, dir_okay=True, allow_dash=True))
 @click.option('--output', '-o', type=click.Path(file_okay=False, dir_okay=True),
               help='Output folder for PNG files (default: same as input)')
 @click.option('--prefix', '-p', 
@@ -115,15 +467,49 @@ class ImageConverter:
               help='PNG compression level (0-9, higher = better compression, slower)')
 @click.option('--interactive', '-i', is_flag=True, help='Use GUI folder selector')
 @click.option('--list-only', '-l', is_flag=True, help='Show what would be converted without doing it')
-def main(folder_path, output, prefix, recursive, quality, interactive, list_only):
+@click.option('--watch', '-w', is_flag=True, help='Keep running and convert new JPG files as they arrive')
+@click.option('--settle', default=2.0, type=click.FloatRange(0), show_default=True,
+              help='Seconds a new file must stay unchanged before it is converted (watch mode)')
+@click.option('--batch-size', default=16, type=click.IntRange(1), show_default=True,
+              help='Maximum number of new files converted per batch (watch mode)')
+@click.option('--dedupe', '-d', is_flag=True,
+              help='Reuse PNGs already converted from identical JPG files instead of re-encoding')
+@click.option('--perceptual', is_flag=True,
+              help='Report images that look nearly identical to an already converted one')
+def main(folder_path, output, prefix, recursive, quality, interactive, list_only, watch, settle, batch_size,
+         dedupe, perceptual):
     """Convert JPG files in a folder to PNG format.
     
     Examples:
         jpg2png.py photos/
         jpg2png.py photos/ --output converted/ --prefix timestamp
         jpg2png.py --interactive --recursive
+        jpg2png.py incoming/ --output converted/ --watch
+        jpg2png.py dumps/ --recursive --dedupe --perceptual
+        cat photo.jpg | jpg2png.py - > photo.png
     """
     
+    # Pipe mode: read JPG data from stdin and write PNG data to stdout
+    if folder_path == '-':
+        ctx = click.get_current_context()
+        folder_only = [f"--{name.replace('_', '-')}" for name in ('output', 'prefix', 'recursive', 'interactive', 'list_only', 'watch',
+                           'settle', 'batch_size', 'dedupe', 'perceptual')
+                       if ctx.get_parameter_source(name) != click.core.ParameterSource.DEFAULT]
+        if folder_only:
+            raise click.UsageError(f"{', '.join(folder_only)} cannot be combined with '-' (stdin/stdout)")
+        try:
+            png_data = ImageConverter.convert_bytes(sys.stdin.buffer.read(), 9-quality)
+        except Exception as e:
+            click.echo(f"❌ Error converting stdin: {e}", err=True)
+            sys.exit(1)
+        sys.stdout.buffer.write(png_data)
+        sys.stdout.buffer.flush()
+        return
+    
+    # file_okay is only enabled so click accepts '-'; regular files are still a usage error
+    if folder_path and not Path(folder_path).is_dir():
+        raise click.BadParameter(f"Directory '{folder_path}' is a file.", param_hint="'FOLDER_PATH'")
+    
     # Use GUI selector if requested
     if interactive or not folder_path:
         root = tk.Tk()
@@ -149,30 +535,66 @@ def main(folder_path, output, prefix, recursive, quality, interactive, list_only
     jpg_files = converter.find_jpg_files() if recursive else [f for f in folder_path.glob('*') 
                                                            if f.suffix.lower() in {'.jpg', '.jpeg'}]
     
-    if not jpg_files:
-        click.echo("✅ No JPG files found in the specified folder.")
-        return
-    
-    click.echo(f"📁 Found {len(jpg_files)} JPG file(s) to convert")
-    
-    if list_only:
-        click.echo("Files that would be converted:")
-        for file in jpg_files:
-            click.echo(f"  {file.name} -> {converter.get_png_filename(file, prefix).name}")
-        return
-    
-    # Convert files
     output_path = Path(output) if output else None
-    results = converter.process_folder(output_path, prefix, recursive, 9-quality)
     
-    # Summary
+    watcher = None
+    if watch and not list_only:
+        # Start watching before the first pass so files arriving during it aren't missed
+        watcher = FolderWatcher(folder_path, converter.supported_extensions, recursive,
+                                settle_time=settle, batch_size=batch_size)
+        watcher.start()
+    
+    try:
+        if not jpg_files:
+            click.echo("✅ No JPG files found in the specified folder.")
+        else:
+            click.echo(f"📁 Found {len(jpg_files)} JPG file(s) to convert")
+            
+            if list_only:
+                click.echo("Files that would be converted:")
+                for file in jpg_files:
+                    click.echo(f"  {file.name} -> {converter.get_png_filename(file, prefix).name}")
+                return
+            
+            # Convert files
+            results = converter.process_folder(output_path, prefix, recursive, 9-quality,
+                                               dedupe=dedupe, perceptual=perceptual)
+            print_summary(results, output_path or folder_path)
+        
+        if watcher is not None:
+            click.echo(f"\n👀 Watching {folder_path} for new JPG files ({watcher.backend}). Press Ctrl+C to stop.")
+            for batch in watcher.watch():
+                # A failed batch must not end the resident process; report it and keep watching
+                try:
+                    results = converter.process_folder(output_path, prefix, recursive, 9-quality, files=batch,
+                                                       dedupe=dedupe, perceptual=perceptual)
+                except Exception as e:
+                    click.echo(f"❌ Error converting batch of {len(batch)} file(s): {e}", err=True)
+                    continue
+                click.echo(f"✅ Batch done: {results['converted']} converted, "
+                           f"{results['deduplicated']} deduplicated, {results['skipped']} skipped")
+                print_near_duplicates(results)
+    except KeyboardInterrupt:
+        if watcher is None:
+            raise
+        click.echo("\n👋 Stopped watching.")
+    finally:
+        if watcher is not None:
+            watcher.stop()
+
+
+def print_summary(results: dict, location: Path):
+    """Print the conversion summary for a finished run."""
     click.echo("\n" + "="*50)
     click.echo(f"✅ Conversion complete!")
     click.echo(f"   📊 Converted: {results['converted']} file(s)")
     click.echo(f"   ⏭️  Skipped: {results['skipped']} file(s)")
+    if results['deduplicated']:
+        click.echo(f"   🔗 Deduplicated: {results['deduplicated']} file(s)")
+    print_near_duplicates(results)
     
     if results['files']:
-        click.echo(f"\n📂 Output location: {output_path or folder_path}")
+        click.echo(f"\n📂 Output location: {location}")
         click.echo("First few files:")
         for i, file in enumerate(results['files'][:3]):
             click.echo(f"  {i+1}. {file.name}")
@@ -181,5 +603,11 @@ def main(folder_path, output, prefix, recursive, quality, interactive, list_only
             click.echo(f"  ... and {len(results['files']) - 3} more files")
 
 
+def print_near_duplicates(results: dict):
+    """Report images that look nearly identical to an already converted one."""
+    for jpg_file, similar in results['near_duplicates']:
+        click.echo(f"   👯 {jpg_file.name} looks like {similar.name}")
+
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -22,6 +22,9 @@ setup(
     url="https://github.com/username/jpg2png-cli",
     py_modules=["jpg2png"],
     install_requires=requirements,
+    extras_require={
+        "watch": ["watchdog>=2.0.0"],  # inotify-backed --watch instead of polling
+    },
     entry_points={
         "console_scripts": [
             "jpg2png=jpg2png:main",
@@ -6,16 +6,165 @@ A simple command-line tool for converting PDF files to DOCX format by extracting
 Usage: python pdf2docx.py [folder_path] [options]
 """
 
+import io
 import os
 import sys
+import time
+import queue
 from pathlib import Path
-from typing import List
+from typing import BinaryIO, Iterator, List, Union
 import click
 from PyPDF2 import PdfReader
 from docx import Document
 import tkinter as tk
 from tkinter import filedialog
 
+# The watch-mode helpers below are kept identical to the ones in jpg2png/jpg2png.py:
+# each tool ships as a standalone module with its own setup.py.
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # Watch mode falls back to polling without watchdog
+    Observer = None
+    FileSystemEventHandler = object
+
+
+class _NewFileHandler(FileSystemEventHandler):
+    """Forwards paths of created, modified and moved-in files to a queue."""
+
+    def __init__(self, events: queue.Queue):
+        self.events = events
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self.events.put(Path(event.src_path))
+
+    on_modified = on_created
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self.events.put(Path(event.dest_path))
+
+
+class FolderWatcher:
+    """Watches a folder for new files and hands them out in micro-batches.
+
+    Uses inotify (through watchdog) when available and falls back to polling.
+    A file is only handed out once its size and mtime have stayed unchanged
+    for ``settle_time`` seconds, so files still being written are never picked up.
+    """
+
+    def __init__(self, folder: Path, extensions: set, recursive: bool = False,
+                 settle_time: float = 2.0, batch_size: int = 16,
+                 batch_window: float = 3.0, poll_interval: float = 1.0):
+        self.folder = Path(folder)
+        self.extensions = {ext.lower() for ext in extensions}
+        self.recursive = recursive
+        self.settle_time = settle_time
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.poll_interval = poll_interval
+        self.backend = 'inotify' if Observer is not None else 'polling'
+        self.events = queue.Queue()
+        self.pending = {}  # path -> ((size, mtime), time the signature was last seen changing)
+        self.seen = {}
+        self.observer = None
+        self.started = False
+
+    def scan(self) -> dict:
+        """Return a {path: (size, mtime)} snapshot of matching files."""
+        pattern = '**/*' if self.recursive else '*'
+        snapshot = {}
+        for path in self.folder.glob(pattern):
+            if path.suffix.lower() in self.extensions:
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def poll(self):
+        """Queue files that appeared or changed since the last scan (polling backend)."""
+        snapshot = self.scan()
+        for path, signature in snapshot.items():
+            if self.seen.get(path) != signature:
+                self.events.put(path)
+        self.seen = snapshot
+
+    def collect_ready(self, now: float) -> List[Path]:
+        """Drain queued events and return the files that have finished writing."""
+        while True:
+            try:
+                path = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if path.suffix.lower() in self.extensions:
+                self.pending.setdefault(path, None)
+
+        ready = []
+        for path, last in list(self.pending.items()):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                del self.pending[path]
+                continue
+            signature = (stat.st_size, stat.st_mtime_ns)
+            if last is None or last[0] != signature:
+                self.pending[path] = (signature, now)
+            elif now - last[1] >= self.settle_time:
+                ready.append(path)
+                del self.pending[path]
+        return ready
+
+    def start(self):
+        """Start collecting events; files that arrive from now on will be handed out.
+        
+        Call this before converting the files already present so that nothing
+        arriving during that first pass is missed.
+        """
+        if self.started:
+            return
+        if self.backend == 'inotify':
+            self.observer = Observer()
+            self.observer.schedule(_NewFileHandler(self.events), str(self.folder),
+                                   recursive=self.recursive)
+            self.observer.start()
+        else:
+            self.seen = self.scan()
+        self.started = True
+
+    def stop(self):
+        """Stop the inotify observer, if one is running."""
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+        self.started = False
+
+    def watch(self) -> Iterator[List[Path]]:
+        """Yield batches of new, fully written files until interrupted."""
+        self.start()
+        batch, batch_started = [], 0.0
+        try:
+            while True:
+                time.sleep(self.poll_interval)
+                if self.backend == 'polling':
+                    self.poll()
+                now = time.monotonic()
+                ready = self.collect_ready(now)
+                if ready and not batch:
+                    batch_started = now
+                batch.extend(ready)
+                while batch and (len(batch) >= self.batch_size
+                                 or now - batch_started >= self.batch_window):
+                    yield sorted(batch[:self.batch_size])
+                    batch = batch[self.batch_size:]
+                    batch_started = now
+        finally:
+            self.stop()
+
+
 class PDFConverter:
     """Handles PDF to DOCX conversion with progress tracking."""
     
@@ -40,32 +189,54 @@ class PDFConverter:
         """Generate DOCX filename from PDF path."""
         return pdf_path.with_suffix('.docx')
     
+    @staticmethod
+    def convert_stream(source: Union[Path, BinaryIO], destination: Union[Path, BinaryIO]):
+        """Convert PDF data to DOCX, reading and writing paths or binary file objects.
+        
+        The source must be seekable. Raises the underlying error if the PDF cannot be read.
+        """
+        reader = PdfReader(source)
+        doc = Document()
+        
+        for page in reader.pages:
+            text = page.extract_text()
+            doc.add_paragraph(text)
+        
+        doc.save(destination)
+    
+    @staticmethod
+    def convert_bytes(data: Union[bytes, BinaryIO]) -> bytes:
+        """Convert PDF bytes (or a binary file object) to DOCX bytes in memory."""
+        if isinstance(data, (bytes, bytearray)):
+            source = io.BytesIO(data)
+        elif not data.seekable():
+            source = io.BytesIO(data.read())
+        else:
+            source = data
+        output = io.BytesIO()
+        PDFConverter.convert_stream(source, output)
+        return output.getvalue()
+    
     def convert_pdf(self, pdf_path: Path, output_path: Path) -> bool:
         """Convert a single PDF to DOCX by extracting text."""
         try:
-            reader = PdfReader(pdf_path)
-            doc = Document()
-            
-            for page in reader.pages:
-                text = page.extract_text()
-                doc.add_paragraph(text)
-            
-            doc.save(output_path)
+            self.convert_stream(pdf_path, output_path)
             return True
             
         except Exception as e:
             click.echo(f"❌ Error converting {pdf_path.name}: {e}", err=True)
             return False
     
-    def process_folder(self, output_folder: Path = None, recursive: bool = False) -> dict:
-        """Process all PDF files in the folder."""
+    def process_folder(self, output_folder: Path = None, recursive: bool = False,
+                       files: List[Path] = None) -> dict:
+        """Process all PDF files in the folder, or only the given files."""
         if output_folder is None:
             output_folder = self.target_folder
         
         # Create output folder if it doesn't exist
         output_folder.mkdir(parents=True, exist_ok=True)
         
-        pdf_files = self.find_pdf_files(recursive)
+        pdf_files = files if files is not None else self.find_pdf_files(recursive)
         
         if not pdf_files:
             return {'converted': 0, 'skipped': 0, 'files': []}
@@ -93,21 +264,50 @@ class PDFConverter:
         return results
 
 @click.command()
-@click.argument('folder_path', required=False, type=click.Path(exists=True, file_okay=False, dir_okay=True))
+@click.argument('folder_path', required=False,
+                type=click.Path(exists=True, file_okay=True, dir_okay=True, allow_dash=True))
 @click.option('--output', '-o', type=click.Path(file_okay=False, dir_okay=True),
               help='Output folder for DOCX files (default: same as input)')
 @click.option('--recursive', '-r', is_flag=True, help='Search subdirectories recursively')
 @click.option('--interactive', '-i', is_flag=True, help='Use GUI folder selector')
 @click.option('--list-only', '-l', is_flag=True, help='Show what would be converted without doing it')
-def main(folder_path, output, recursive, interactive, list_only):
+@click.option('--watch', '-w', is_flag=True, help='Keep running and convert new PDF files as they arrive')
+@click.option('--settle', default=2.0, type=click.FloatRange(0), show_default=True,
+              help='Seconds a new file must stay unchanged before it is converted (watch mode)')
+@click.option('--batch-size', default=16, type=click.IntRange(1), show_default=True,
+              help='Maximum number of new files converted per batch (watch mode)')
+def main(folder_path, output, recursive, interactive, list_only, watch, settle, batch_size):
     """Convert PDF files in a folder to DOCX format.
     
     Examples:
         pdf2docx.py documents/
         pdf2docx.py documents/ --output converted/ --recursive
         pdf2docx.py --interactive
+        pdf2docx.py incoming/ --output converted/ --watch
+        cat report.pdf | pdf2docx.py - > report.docx
     """
     
+    # Pipe mode: read PDF data from stdin and write DOCX data to stdout
+    if folder_path == '-':
+        ctx = click.get_current_context()
+        folder_only = [f"--{name.replace('_', '-')}" for name in ('output', 'recursive', 'interactive', 'list_only', 'watch',
+                           'settle', 'batch_size')
+                       if ctx.get_parameter_source(name) != click.core.ParameterSource.DEFAULT]
+        if folder_only:
+            raise click.UsageError(f"{', '.join(folder_only)} cannot be combined with '-' (stdin/stdout)")
+        try:
+            docx_data = PDFConverter.convert_bytes(sys.stdin.buffer.read())
+        except Exception as e:
+            click.echo(f"❌ Error converting stdin: {e}", err=True)
+            sys.exit(1)
+        sys.stdout.buffer.write(docx_data)
+        sys.stdout.buffer.flush()
+        return
+    
+    # file_okay is only enabled so click accepts '-'; regular files are still a usage error
+    if folder_path and not Path(folder_path).is_dir():
+        raise click.BadParameter(f"Directory '{folder_path}' is a file.", param_hint="'FOLDER_PATH'")
+    
     # Use GUI selector if requested
     if interactive or not folder_path:
         root = tk.Tk()
@@ -132,30 +332,58 @@ def main(folder_path, output, recursive, interactive, list_only):
     converter = PDFConverter(folder_path)
     pdf_files = converter.find_pdf_files(recursive)
     
-    if not pdf_files:
-        click.echo("✅ No PDF files found in the specified folder.")
-        return
-    
-    click.echo(f"📁 Found {len(pdf_files)} PDF file(s) to convert")
-    
-    if list_only:
-        click.echo("Files that would be converted:")
-        for file in pdf_files:
-            click.echo(f"  {file.name} -> {converter.get_docx_filename(file).name}")
-        return
-    
-    # Convert files
     output_path = Path(output) if output else None
-    results = converter.process_folder(output_path, recursive)
     
-    # Summary
+    watcher = None
+    if watch and not list_only:
+        # Start watching before the first pass so files arriving during it aren't missed
+        watcher = FolderWatcher(folder_path, converter.supported_extensions, recursive,
+                                settle_time=settle, batch_size=batch_size)
+        watcher.start()
+    
+    try:
+        if not pdf_files:
+            click.echo("✅ No PDF files found in the specified folder.")
+        else:
+            click.echo(f"📁 Found {len(pdf_files)} PDF file(s) to convert")
+            
+            if list_only:
+                click.echo("Files that would be converted:")
+                for file in pdf_files:
+                    click.echo(f"  {file.name} -> {converter.get_docx_filename(file).name}")
+                return
+            
+            # Convert files
+            results = converter.process_folder(output_path, recursive)
+            print_summary(results, output_path or folder_path)
+        
+        if watcher is not None:
+            click.echo(f"\n👀 Watching {folder_path} for new PDF files ({watcher.backend}). Press Ctrl+C to stop.")
+            for batch in watcher.watch():
+                # A failed batch must not end the resident process; report it and keep watching
+                try:
+                    results = converter.process_folder(output_path, recursive, files=batch)
+                except Exception as e:
+                    click.echo(f"❌ Error converting batch of {len(batch)} file(s): {e}", err=True)
+                    continue
+                click.echo(f"✅ Batch done: {results['converted']} converted, {results['skipped']} skipped")
+    except KeyboardInterrupt:
+        if watcher is None:
+            raise
+        click.echo("\n👋 Stopped watching.")
+    finally:
+        if watcher is not None:
+            watcher.stop()
+
+def print_summary(results: dict, location: Path):
+    """Print the conversion summary for a finished run."""
     click.echo("\n" + "="*50)
-    click.echo("✅ Conversion complete!"
+    click.echo("✅ Conversion complete!")
     click.echo(f"   📊 Converted: {results['converted']} file(s)")
     click.echo(f"   ⏭️  Skipped: {results['skipped']} file(s)")
     
     if results['files']:
-        click.echo(f"\n📂 Output location: {output_path or folder_path}")
+        click.echo(f"\n📂 Output location: {location}")
         click.echo("First few files:")
         for i, file in enumerate(results['files'][:3]):
             click.echo(f"  {i+1}. {file.name}")
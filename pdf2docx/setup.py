@@ -26,6 +26,9 @@ setup(
     url="https://github.com/username/pdf2docx-cli",
     py_modules=["pdf2docx"],
     install_requires=requirements,
+    extras_require={
+        "watch": ["watchdog>=2.0.0"],  # inotify-backed --watch instead of polling
+    },
     entry_points={
         "console_scripts": [
             "pdf2docx=pdf2docx:main",
@@ -9,6 +9,7 @@ from langchain.chains import LLMChain
 import openpyxl
 from docx import Document
 import PyPDF2
+from retrieval import VectorIndex
 
 # Directory to read files from
 DATA_DIR = "./data"  # You can change this to the directory you want
@@ -16,6 +17,10 @@ DATA_DIR = "./data"  # You can change this to the directory you want
 # Ensure the data directory exists
 os.makedirs(DATA_DIR, exist_ok=True)
 
+# Semantic index over DATA_DIR; pass embed=<your local embedding function> and a matching
+# embedder_id="<model name>" for better recall
+retrieval_index = VectorIndex(DATA_DIR)
+
 # Tool for reading PDF files
 @tool
 def read_pdf(file_path: str) -> str:
@@ -124,6 +129,19 @@ def search_files(query: str, directory: str = DATA_DIR) -> str:
     except Exception as e:
         return f"Error searching: {str(e)}"
 
+# Tool for semantic search over the indexed documents
+@tool
+def semantic_search(query: str) -> str:
+    """Find the passages in the data directory most relevant to a question. Prefer this over reading whole files."""
+    try:
+        retrieval_index.update()
+        hits = retrieval_index.search(query, k=5)
+        if not hits:
+            return "No relevant passages found."
+        return "\n\n".join(f"[{file}] (score {score:.2f})\n{text}" for score, file, text in hits)
+    except Exception as e:
+        return f"Error searching index: {str(e)}"
+
 # Tool to get file info
 @tool
 def get_file_info(file_path: str) -> str:
@@ -175,7 +193,7 @@ def list_files_by_type(extension: str, directory: str = DATA_DIR) -> str:
 llm = Ollama(model="llama2")  # Change to your preferred model
 
 # List of tools
-tools = [read_pdf, read_word, read_excel, read_text_file, list_files, search_files, get_file_info, summarize_file, list_files_by_type]
+tools = [read_pdf, read_word, read_excel, read_text_file, list_files, search_files, semantic_search, get_file_info, summarize_file, list_files_by_type]
 
 # Initialize the agent
 agent = initialize_agent(tools, llm, agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION, verbose=True)
@@ -0,0 +1,264 @@
+"""
+Local semantic retrieval for Spot.
+
+Splits the documents in the data directory into chunks, embeds them with a pluggable
+embedding function and keeps the vectors in a memory-mapped NumPy matrix, so only the
+chunks relevant to a question have to be handed to the LLM.
+"""
+
+import os
+import re
+import json
+import hashlib
+import numpy as np
+import openpyxl
+import PyPDF2
+from docx import Document
+
+# openpyxl cannot read legacy .xls workbooks, so only .xlsx is indexed
+SUPPORTED_EXTENSIONS = ('.txt', '.md', '.pdf', '.docx', '.xlsx')
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def hashing_embedder(texts, dim=512):
+    """Embed texts as signed bag-of-words vectors using the hashing trick.
+
+    Deterministic and dependency free, which makes it suitable for tests and offline
+    use. Pass a real local embedding model to VectorIndex for better recall.
+    """
+    vectors = np.zeros((len(texts), dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for token in TOKEN_PATTERN.findall(text.lower()):
+            value = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+            vectors[row, value % dim] += 1.0 if value >> 63 else -1.0
+    return vectors
+
+
+def chunk_text(text, chunk_words=200, overlap=40):
+    """Split text into overlapping chunks of roughly chunk_words words."""
+    words = text.split()
+    if not words:
+        return []
+    step = max(chunk_words - overlap, 1)
+    return [" ".join(words[start:start + chunk_words])
+            for start in range(0, max(len(words) - overlap, 1), step)]
+
+
+def extract_text(file_path):
+    """Extract plain text from a supported document."""
+    lower = file_path.lower()
+    if lower.endswith('.pdf'):
+        with open(file_path, 'rb') as f:
+            reader = PyPDF2.PdfReader(f)
+            return "\n".join(page.extract_text() or "" for page in reader.pages)
+    if lower.endswith('.docx'):
+        doc = Document(file_path)
+        return "\n".join(para.text for para in doc.paragraphs)
+    if lower.endswith('.xlsx'):
+        wb = openpyxl.load_workbook(file_path, read_only=True)
+        lines = []
+        for sheet in wb.worksheets:
+            for row in sheet.iter_rows(values_only=True):
+                lines.append(" ".join(str(cell) if cell else "" for cell in row))
+        return "\n".join(lines)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+class VectorIndex:
+    """Chunk embeddings for a directory, stored in a memory-mapped matrix.
+
+    Each file owns a contiguous range of rows. When a file changes or disappears its
+    rows are marked dead and its new chunks are appended, so an update only embeds and
+    writes the files that actually changed. Chunk text lives in one small store per
+    file; the shared metadata only records row ranges. Dead rows are compacted away
+    once they make up half of the matrix.
+    """
+
+    def __init__(self, data_dir, index_dir=None, embed=hashing_embedder, chunk_words=200, overlap=40,
+                 embedder_id=None):
+        self.data_dir = data_dir
+        # Keep the index next to, not inside, the data directory so file listings stay clean
+        data_path = os.path.abspath(data_dir)
+        self.index_dir = index_dir or os.path.join(os.path.dirname(data_path),
+                                                   f".{os.path.basename(data_path)}_spot_index")
+        self.chunks_dir = os.path.join(self.index_dir, 'chunks')
+        self.embed = embed
+        # Identifies the embedding model in the saved index; pass embedder_id whenever the
+        # function's name alone doesn't (e.g. functools.partial or a model wrapper)
+        self.embedder_id = embedder_id or getattr(embed, '__name__', type(embed).__name__)
+        self.dim = int(np.asarray(embed(['dimension probe'])).shape[1])
+        self.chunk_words = chunk_words
+        self.overlap = overlap
+        self.vectors_path = os.path.join(self.index_dir, 'vectors.npy')
+        self.meta_path = os.path.join(self.index_dir, 'meta.json')
+        self.vectors = None  # memmap of shape (capacity, dim); rows past count are unused
+        self.count = 0
+        self.files = {}      # file name -> {'signature': [mtime_ns, size], 'start': row, 'count': rows}
+        self.alive = np.zeros(0, dtype=bool)
+        self.row_files = []  # file name owning each row, or None once deleted
+        self._texts = {}     # file name -> cached list of chunk texts
+        self._load()
+
+    def _load(self):
+        """Open an existing index, discarding it if it was built with another embedder."""
+        if not (os.path.exists(self.meta_path) and os.path.exists(self.vectors_path)):
+            return
+        with open(self.meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('embedder') != self.embedder_id or meta.get('dim') != self.dim:
+            return
+        vectors = np.load(self.vectors_path, mmap_mode='r+')
+        if vectors.shape[1] != self.dim:
+            return
+        self.vectors = vectors
+        self.count = meta['count']
+        self.files = meta['files']
+        self._rebuild_rows()
+
+    def _rebuild_rows(self):
+        self.alive = np.zeros(self.count, dtype=bool)
+        self.row_files = [None] * self.count
+        for name, entry in self.files.items():
+            rows = slice(entry['start'], entry['start'] + entry['count'])
+            self.alive[rows] = True
+            self.row_files[rows] = [name] * entry['count']
+
+    def _save(self):
+        if self.vectors is not None:
+            self.vectors.flush()
+        meta = {'embedder': self.embedder_id, 'dim': self.dim,
+                'count': self.count, 'files': self.files}
+        tmp_path = self.meta_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, self.meta_path)
+
+    def _store_path(self, name):
+        digest = hashlib.blake2b(name.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.chunks_dir, f"{digest}.json")
+
+    def _chunk_texts(self, name):
+        if name not in self._texts:
+            with open(self._store_path(name), 'r', encoding='utf-8') as f:
+                self._texts[name] = json.load(f)
+        return self._texts[name]
+
+    def _write_matrix(self, rows, capacity):
+        """Replace the memmap with a new one of the given capacity holding rows."""
+        os.makedirs(self.index_dir, exist_ok=True)
+        tmp_path = self.vectors_path + '.tmp.npy'
+        matrix = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float32, shape=(capacity, self.dim))
+        if len(rows):
+            matrix[:len(rows)] = rows
+        matrix.flush()
+        del matrix
+        self.vectors = None
+        os.replace(tmp_path, self.vectors_path)
+        self.vectors = np.load(self.vectors_path, mmap_mode='r+')
+
+    def _append(self, name, chunks):
+        """Embed chunks for a file, append them as new rows and return the first row."""
+        vectors = _normalize(self.embed(chunks))
+        needed = self.count + len(chunks)
+        if self.vectors is None or needed > self.vectors.shape[0]:
+            capacity = max(needed, 1024, 2 * (self.vectors.shape[0] if self.vectors is not None else 0))
+            existing = self.vectors[:self.count] if self.vectors is not None else np.zeros((0, self.dim))
+            self._write_matrix(np.array(existing), capacity)
+        start = self.count
+        self.vectors[start:needed] = vectors
+        self.count = needed
+        self.alive = np.concatenate([self.alive, np.ones(len(chunks), dtype=bool)])
+        self.row_files.extend([name] * len(chunks))
+
+        os.makedirs(self.chunks_dir, exist_ok=True)
+        with open(self._store_path(name), 'w', encoding='utf-8') as f:
+            json.dump(chunks, f)
+        self._texts[name] = chunks
+        return start
+
+    def _drop(self, name):
+        entry = self.files.pop(name, None)
+        if entry is None:
+            return
+        rows = slice(entry['start'], entry['start'] + entry['count'])
+        self.alive[rows] = False
+        self.row_files[rows] = [None] * entry['count']
+        self._texts.pop(name, None)
+        if os.path.exists(self._store_path(name)):
+            os.remove(self._store_path(name))
+
+    def _compact(self):
+        """Rewrite the matrix without dead rows."""
+        keep = np.flatnonzero(self.alive)
+        alive_before = np.concatenate([[0], np.cumsum(self.alive)])  # live rows preceding each row
+        self._write_matrix(np.array(self.vectors[keep]), max(len(keep), 1024))
+        for entry in self.files.values():
+            entry['start'] = int(alive_before[entry['start']])
+        self.count = len(keep)
+        self._rebuild_rows()
+
+    def update(self):
+        """Index new and changed files and forget deleted ones.
+
+        Returns the number of files that were (re-)indexed.
+        """
+        current = {}
+        for name in sorted(os.listdir(self.data_dir)):
+            path = os.path.join(self.data_dir, name)
+            if name.lower().endswith(SUPPORTED_EXTENSIONS) and os.path.isfile(path):
+                stat = os.stat(path)
+                current[name] = [stat.st_mtime_ns, stat.st_size]
+
+        changed = [name for name, signature in current.items()
+                   if self.files.get(name, {}).get('signature') != signature]
+        removed = [name for name in self.files if name not in current]
+        if not changed and not removed:
+            return 0
+
+        for name in removed + changed:
+            self._drop(name)
+        for name in changed:
+            try:
+                chunks = chunk_text(extract_text(os.path.join(self.data_dir, name)),
+                                    self.chunk_words, self.overlap)
+            except Exception as e:
+                print(f"Skipping {name} in semantic index: {e}")
+                chunks = []
+            start = self._append(name, chunks) if chunks else self.count
+            self.files[name] = {'signature': current[name], 'start': start, 'count': len(chunks)}
+
+        if self.count > 1024 and self.alive.sum() < self.count // 2:
+            self._compact()
+        self._save()
+        return len(changed)
+
+    def search(self, query, k=5, min_score=0.1):
+        """Return up to k (score, file name, chunk text) tuples, best match first.
+
+        Chunks scoring at or below min_score (cosine similarity) are left out, so an
+        unrelated query returns nothing rather than the least bad chunks.
+        """
+        live = int(self.alive.sum())
+        if live == 0:
+            return []
+        query_vector = _normalize(self.embed([query]))[0]
+        scores = np.asarray(self.vectors[:self.count] @ query_vector)
+        scores[~self.alive] = -np.inf
+        k = min(k, live)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        hits = []
+        for row in top:
+            if scores[row] <= min_score:
+                break
+            name = self.row_files[row]
+            text = self._chunk_texts(name)[row - self.files[name]['start']]
+            hits.append((float(scores[row]), name, text))
+        return hits